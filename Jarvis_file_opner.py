@@ -36,7 +36,7 @@ async def focus_window(title_keyword: str) -> bool:
     logger.warning("⚠ Focus करने के लिए window नहीं मिली।")
     return False
 
-async def index_files(base_dirs):
+def _walk_files(base_dirs):
     file_index = []
     for base_dir in base_dirs:
         for root, _, files in os.walk(base_dir):
@@ -46,6 +46,11 @@ async def index_files(base_dirs):
                     "path": os.path.join(root, f),
                     "type": "file"
                 })
+    return file_index
+
+async def index_files(base_dirs):
+    # os.walk over a whole drive takes seconds - keep it off the event loop
+    file_index = await asyncio.to_thread(_walk_files, base_dirs)
     logger.info(f"✅ {base_dirs} से कुल {len(file_index)} files को index किया गया।")
     return file_index
 
@@ -1,11 +1,21 @@
 import os
 import sys
 import asyncio
+import atexit
+import functools
+import importlib.util
+import itertools
 import shutil
+import time
+import threading
 import webbrowser
 import ctypes
+import json
+import queue
+import re
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from urllib.parse import quote_plus
+from typing import Optional, Dict, Any, List, Tuple
 
 # LiveKit decorator (safe import)
 from livekit.agents import function_tool
@@ -16,11 +26,55 @@ try:
 except Exception:
     psutil = None
 
-# Optional OpenCV for camera
-try:
-    import cv2
-except Exception:
-    cv2 = None
+# Optional OpenCV for camera. It is only needed by capture_photo and takes
+# hundreds of ms to import, so it is loaded on first use by the camera thread.
+@functools.lru_cache(maxsize=None)
+def _get_cv2():
+    try:
+        import cv2
+    except Exception:
+        return None
+    return cv2
+
+# Default locations, resolved once instead of probing the profile on every call
+_HOME = Path.home()
+_DOCUMENTS = _HOME / "Documents"
+_VIDEOS = _HOME / "Videos"
+_PICTURES_JARVIS = _HOME / "Pictures" / "JarvisPhotos"
+_NEW_FOLDER = _HOME / "NewFolder_Jarvis"
+
+# Native Win32 entry points, resolved once at import instead of per call
+_SetSuspendState = None
+_LockWorkStation = None
+_ShellExecuteW = None
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    try:
+        # BOOLEAN SetSuspendState(BOOLEAN Hibernate, BOOLEAN ForceCritical, BOOLEAN DisableWakeEvent);
+        _powrprof = ctypes.WinDLL("PowrProf")
+        _SetSuspendState = _powrprof.SetSuspendState
+        _SetSuspendState.argtypes = [wintypes.BOOLEAN] * 3
+        _SetSuspendState.restype = wintypes.BOOLEAN
+    except Exception:
+        _SetSuspendState = None
+
+    try:
+        _LockWorkStation = ctypes.windll.user32.LockWorkStation
+        _LockWorkStation.argtypes = []
+        _LockWorkStation.restype = wintypes.BOOL
+    except Exception:
+        _LockWorkStation = None
+
+    try:
+        # HINSTANCE ShellExecuteW(HWND, LPCWSTR op, LPCWSTR file, LPCWSTR params, LPCWSTR dir, INT show);
+        # Return value is an INT_PTR; anything <= 32 is an error code.
+        _ShellExecuteW = ctypes.windll.shell32.ShellExecuteW
+        _ShellExecuteW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR,
+                                   wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_int]
+        _ShellExecuteW.restype = ctypes.c_ssize_t
+    except Exception:
+        _ShellExecuteW = None
 
 # ---------------------------------------------
 # Helper: Run commands asynchronously
@@ -42,6 +96,64 @@ async def _run_async(cmd: List[str]) -> Dict[str, Any]:
     except Exception as e:
         return {"returncode": -1, "error": str(e)}
 
+
+async def _run_async_text(cmd: List[str], limit: int = 65536) -> Dict[str, Any]:
+    """Run a command and return at most `limit` bytes of its stdout, read incrementally."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        chunks = []
+        size = 0
+        while size < limit:
+            chunk = await proc.stdout.read(limit - size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+        # drain anything past the cap so the child never blocks on a full pipe
+        while await proc.stdout.read(limit):
+            pass
+        await proc.wait()
+        return {
+            "returncode": proc.returncode,
+            "stdout": b"".join(chunks).decode(errors="ignore").strip(),
+        }
+    except Exception as e:
+        return {"returncode": -1, "error": str(e)}
+
+
+async def _spawn_async(cmd: List[str]) -> int:
+    """Start a fire-and-forget subprocess and return its pid without waiting for it."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    return proc.pid
+
+
+# ShellExecute return codes for a missing file / path (SE_ERR_FNF, SE_ERR_PNF)
+_SE_ERR_NOT_FOUND = (2, 3)
+
+
+def _shell_open(target: str) -> None:
+    """Open a file, folder, URL or app with its default handler.
+
+    ShellExecuteW is synchronous: it resolves App Paths and file associations
+    and may load shell extensions, so callers run it via asyncio.to_thread.
+    """
+    if _ShellExecuteW is None:
+        os.startfile(target)
+        return
+    rc = _ShellExecuteW(None, "open", str(target), None, None, 1)
+    if rc in _SE_ERR_NOT_FOUND:
+        raise FileNotFoundError(f"Path not found: {target}")
+    if rc <= 32:
+        raise OSError(f"ShellExecute failed: {rc}")
+
 # ---------------------------------------------
 # Core Windows control tools
 # ---------------------------------------------
@@ -54,7 +166,7 @@ async def shutdown_system(force: bool = False) -> Dict[str, Any]:
         if force:
             cmd.append("/f")
         # Start the shutdown command and return immediately
-        await _run_async(cmd)
+        await _spawn_async(cmd)
         return {"ok": True, "action": "shutdown", "cmd": " ".join(cmd)}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -67,7 +179,7 @@ async def restart_system(force: bool = False) -> Dict[str, Any]:
         cmd = ["shutdown", "/r", "/t", "0"]
         if force:
             cmd.append("/f")
-        await _run_async(cmd)
+        await _spawn_async(cmd)
         return {"ok": True, "action": "restart", "cmd": " ".join(cmd)}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -92,15 +204,16 @@ async def sleep_system() -> Dict[str, Any]:
     try:
         # Try calling powrprof.SetSuspendState through ctypes (requires appropriate privileges)
         try:
-            powr = ctypes.WinDLL("PowrProf")
-            # BOOL SetSuspendState(BOOL Hibernate, BOOL ForceCritical, BOOL DisableWakeEvent);
+            if _SetSuspendState is None:
+                raise OSError("SetSuspendState not available")
             # We want sleep (hibernate=False), ForceCritical=False, DisableWakeEvent=False
-            rc = powr.SetSuspendState(False, False, False)
+            # Run in a thread: the call blocks until the machine resumes
+            rc = await asyncio.to_thread(_SetSuspendState, False, False, False)
             # If call succeeded, rc may be non-zero
             return {"ok": True, "action": "sleep", "rc": bool(rc)}
         except Exception:
-            # fallback to the previous approach (rundll32) in a thread to avoid blocking
-            await asyncio.to_thread(os.system, "rundll32.exe powrprof.dll,SetSuspendState 0,1,0")
+            # fallback to the previous approach (rundll32) without blocking
+            await _spawn_async(["rundll32.exe", "powrprof.dll,SetSuspendState", "0,1,0"])
             return {"ok": True, "action": "sleep", "fallback": True}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -113,8 +226,9 @@ async def sleep_system() -> Dict[str, Any]:
 async def lock_screen() -> Dict[str, Any]:
     """Lock the Windows session immediately."""
     try:
-        # Use user32 LockWorkStation
-        ctypes.windll.user32.LockWorkStation()
+        if _LockWorkStation is None:
+            return {"ok": False, "error": "LockWorkStation not available"}
+        _LockWorkStation()
         return {"ok": True, "action": "lock_screen"}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -123,15 +237,39 @@ async def lock_screen() -> Dict[str, Any]:
 # Folder & file management
 # ---------------------------------------------
 
+def _find_first_pdf(root: str) -> Optional[str]:
+    """Walk root with os.scandir and return the first PDF found (stops early)."""
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_file() and e.name.lower().endswith(".pdf"):
+                        return e.path
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+        except OSError:
+            continue
+    return None
+
+
+def _list_names(path: str) -> List[str]:
+    """Return entry names in path using os.scandir (no Path object per entry)."""
+    with os.scandir(path) as it:
+        return [e.name for e in it]
+
+
 @function_tool
 async def create_folder(path: Optional[str] = None) -> Dict[str, Any]:
     """Create a new folder."""
     try:
         if not path:
-            path = str(Path.home() / "NewFolder_Jarvis")
-        p = Path(path)
-        await asyncio.to_thread(p.mkdir, parents=True, exist_ok=True)
-        return {"ok": True, "path": str(p.resolve())}
+            path = str(_NEW_FOLDER)
+        p = Path(path).expanduser()
+        p.mkdir(parents=True, exist_ok=True)
+        # abspath is pure string work; resolve() would stat/readlink every component again
+        return {"ok": True, "path": os.path.abspath(p)}
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
@@ -142,11 +280,10 @@ async def list_folder_items(path: Optional[str] = None) -> Dict[str, Any]:
     try:
         if not path:
             path = os.getcwd()
-        p = Path(path)
-        if not p.exists() or not p.is_dir():
+        if not os.path.isdir(path):
             return {"ok": False, "error": "Invalid directory"}
-        items = await asyncio.to_thread(lambda: [c.name for c in p.iterdir()])
-        return {"ok": True, "path": str(p), "items": items}
+        items = await asyncio.to_thread(_list_names, path)
+        return {"ok": True, "path": str(path), "items": items}
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
@@ -155,23 +292,11 @@ async def list_folder_items(path: Optional[str] = None) -> Dict[str, Any]:
 async def open_file(path: Optional[str] = None) -> Dict[str, Any]:
     """Open a file or folder. If no path provided, open user's Documents folder."""
     try:
-        if not path:
-            default = Path.home() / "Documents"
-            await asyncio.to_thread(os.startfile, str(default))
-            return {"ok": True, "opened": str(default)}
-
-        p = Path(path)
-        if not p.exists():
-            return {"ok": False, "error": f"Path not found: {path}"}
-
-        # If it's a folder - open in Explorer
-        if p.is_dir():
-            await asyncio.to_thread(os.startfile, str(p))
-            return {"ok": True, "opened": str(p)}
-
-        # If it's a file - open with default application
-        await asyncio.to_thread(os.startfile, str(p))
-        return {"ok": True, "opened": str(p)}
+        target = path or str(_DOCUMENTS)
+        # ShellExecute opens files and folders alike and reports a missing
+        # path itself (return code <= 32), so no exists()/is_dir() checks.
+        await asyncio.to_thread(_shell_open, target)
+        return {"ok": True, "opened": target}
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
@@ -180,15 +305,15 @@ async def open_file(path: Optional[str] = None) -> Dict[str, Any]:
 async def open_pdf_in_folder(folder: Optional[str] = None) -> Dict[str, Any]:
     """Find the first PDF in a folder and open it. If no folder provided, search Documents."""
     try:
-        folder = folder or str(Path.home() / "Documents")
+        folder = folder or str(_DOCUMENTS)
         p = Path(folder)
         if not p.exists() or not p.is_dir():
             return {"ok": False, "error": "Invalid folder"}
-        pdfs = list(p.rglob("*.pdf"))
-        if not pdfs:
+        first = await asyncio.to_thread(_find_first_pdf, str(p))
+        if not first:
             return {"ok": False, "error": "No PDF files found"}
-        await asyncio.to_thread(os.startfile, str(pdfs[0]))
-        return {"ok": True, "opened": str(pdfs[0])}
+        await asyncio.to_thread(_shell_open, first)
+        return {"ok": True, "opened": first}
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
@@ -196,31 +321,62 @@ async def open_pdf_in_folder(folder: Optional[str] = None) -> Dict[str, Any]:
 # Run application / media (improved)
 # ---------------------------------------------
 
+# shutil.which results keyed by name -> (exe or None, lookup time).
+# Entries expire so newly installed apps are picked up.
+_WHICH_TTL = 300.0
+_which_cache: Dict[str, Tuple[Optional[str], float]] = {}
+
+
+def _which_cached(name: str) -> Optional[str]:
+    """shutil.which with a small TTL cache to avoid rescanning PATH every call."""
+    now = time.monotonic()
+    hit = _which_cache.get(name)
+    if hit is not None and now - hit[1] < _WHICH_TTL:
+        return hit[0]
+    exe = shutil.which(name)
+    _which_cache[name] = (exe, now)
+    return exe
+
+
+_MEDIA_EXTS = (".mp4", ".mp3", ".mkv")
+
+
+def _first_media(folder: str) -> Optional[str]:
+    """Return the first media file in folder using a single scandir pass."""
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                if e.is_file() and e.name.lower().endswith(_MEDIA_EXTS):
+                    return e.path
+    except OSError:
+        return None
+    return None
+
+
 @function_tool
 async def run_application_or_media(app_name_or_path: Optional[str] = None,
                                    folder: Optional[str] = None) -> Dict[str, Any]:
     """Run a given application or play media if found."""
     try:
         if app_name_or_path:
-            exe = shutil.which(app_name_or_path)
+            exe = _which_cached(app_name_or_path)
             if exe:
                 # use create_subprocess_exec so we don't block
                 try:
                     await asyncio.create_subprocess_exec(exe)
                 except Exception:
-                    # fallback to startfile
-                    await asyncio.to_thread(os.startfile, exe)
+                    # fallback to the shell handler
+                    await asyncio.to_thread(_shell_open, exe)
                 return {"ok": True, "ran": exe}
             path = Path(app_name_or_path)
             if path.exists():
-                await asyncio.to_thread(os.startfile, str(path))
+                await asyncio.to_thread(_shell_open, str(path))
                 return {"ok": True, "opened": str(path)}
-        folder = folder or str(Path.home() / "Videos")
-        for ext in ("*.mp4", "*.mp3", "*.mkv"):
-            files = list(Path(folder).glob(ext))
-            if files:
-                await asyncio.to_thread(os.startfile, str(files[0]))
-                return {"ok": True, "opened": str(files[0])}
+        folder = folder or str(_VIDEOS)
+        hit = await asyncio.to_thread(_first_media, folder)
+        if hit:
+            await asyncio.to_thread(_shell_open, hit)
+            return {"ok": True, "opened": hit}
         return {"ok": False, "error": "No file or app found"}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -243,18 +399,99 @@ async def get_battery_info() -> Dict[str, Any]:
         return {"ok": False, "error": str(e)}
 
 
+# "    Key           : value" lines from netsh output
+_NETSH_FIELD_RE = re.compile(r"^[ \t]*([^:\r\n]+?)[ \t]*:[ \t]*([^\r\n]+?)[ \t\r]*$", re.MULTILINE)
+
+
+def _parse_netsh_interfaces(stdout: str) -> List[Dict[str, str]]:
+    """Split netsh output into one field dict per interface (each block starts at 'Name')."""
+    blocks: List[Dict[str, str]] = []
+    for key, value in _NETSH_FIELD_RE.findall(stdout):
+        if key == "Name" or not blocks:
+            blocks.append({})
+        blocks[-1][key] = value
+    return [b for b in blocks if "State" in b]
+
+
 @function_tool
 async def wifi_status() -> Dict[str, Any]:
-    """Check Wi-Fi status."""
-    res = await _run_async(["netsh", "wlan", "show", "interfaces"])
-    return {"ok": True, "output": res.get("stdout")}
+    """Check Wi-Fi status (SSID, signal, state, BSSID, channel) of each wireless interface."""
+    res = await _run_async_text(["netsh", "wlan", "show", "interfaces"])
+    stdout = res.get("stdout")
+    if not stdout:
+        return {"ok": False, "error": res.get("error") or "No output from netsh"}
+    blocks = _parse_netsh_interfaces(stdout)
+    if not blocks:
+        # e.g. WLAN service not running - pass the message through as is
+        return {"ok": False, "error": stdout}
+    interfaces = [
+        {
+            "name": fields.get("Name"),
+            "ssid": fields.get("SSID"),
+            "signal": fields.get("Signal"),
+            "state": fields.get("State"),
+            # Windows 10/11 label this "AP BSSID"; older builds use "BSSID"
+            "bssid": fields.get("AP BSSID") or fields.get("BSSID"),
+            "channel": fields.get("Channel"),
+        }
+        for fields in blocks
+    ]
+    return {"ok": True, "interfaces": interfaces}
+
+
+def _wmi_bluetooth_devices() -> List[Dict[str, Any]]:
+    """Query present Bluetooth PnP devices over WMI. Runs in a worker thread.
+
+    Uses pywin32 (already a dependency) and imports it here, so neither the
+    import nor COM initialisation touches the event loop. Raises if pywin32
+    is unavailable; the caller then falls back to PowerShell.
+    """
+    import pythoncom
+    import win32com.client
+
+    pythoncom.CoInitialize()
+    try:
+        wmi = win32com.client.GetObject("winmgmts:")
+        devices = wmi.ExecQuery(
+            "SELECT Name, Status, DeviceID FROM Win32_PnPEntity WHERE PNPClass = 'Bluetooth'"
+        )
+        return [{"name": d.Name, "status": d.Status, "device_id": d.DeviceID} for d in devices]
+    finally:
+        pythoncom.CoUninitialize()
 
 
 @function_tool
 async def bluetooth_status() -> Dict[str, Any]:
-    """Check Bluetooth devices."""
-    res = await _run_async(["powershell", "-Command", "Get-PnpDevice -Class Bluetooth"])
-    return {"ok": True, "output": res.get("stdout")}
+    """Check Bluetooth devices that are currently present."""
+    try:
+        devices = await asyncio.to_thread(_wmi_bluetooth_devices)
+        return {"ok": True, "devices": devices}
+    except Exception:
+        # pywin32 missing or the query failed - fall back to PowerShell below
+        pass
+    # -PresentOnly matches Win32_PnPEntity, which only lists present devices.
+    # With no devices Get-PnpDevice raises "No matching ... objects found";
+    # SilentlyContinue turns that into empty output, i.e. devices: [].
+    res = await _run_async_text([
+        "powershell", "-NoProfile", "-Command",
+        "Get-PnpDevice -Class Bluetooth -PresentOnly -ErrorAction SilentlyContinue"
+        " | Select-Object FriendlyName,Status,InstanceId | ConvertTo-Json -Compress",
+    ])
+    stdout = res.get("stdout")
+    if res.get("returncode") != 0:
+        return {"ok": False, "error": res.get("error") or stdout or "Get-PnpDevice failed"}
+    try:
+        data = json.loads(stdout) if stdout else []
+    except ValueError:
+        return {"ok": False, "error": "Could not parse PowerShell output"}
+    # ConvertTo-Json emits a bare object when there is only one device
+    if isinstance(data, dict):
+        data = [data]
+    devices = [
+        {"name": d.get("FriendlyName"), "status": d.get("Status"), "device_id": d.get("InstanceId")}
+        for d in data
+    ]
+    return {"ok": True, "devices": devices}
 
 # ---------------------------------------------
 # Open common applications and websites
@@ -264,17 +501,39 @@ async def bluetooth_status() -> Dict[str, Any]:
 async def open_quick_settings(section: Optional[str] = None) -> Dict[str, Any]:
     """Open Windows Settings."""
     uri = f"ms-settings:{section or ''}"
-    await asyncio.to_thread(os.system, f"start {uri}")
+    try:
+        await asyncio.to_thread(_shell_open, uri)
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
     return {"ok": True, "opened": uri}
 
 
 @function_tool
 async def open_system_info() -> Dict[str, Any]:
     """Open Windows system info panel."""
-    await asyncio.to_thread(os.system, "msinfo32")
+    try:
+        await asyncio.to_thread(_shell_open, "msinfo32.exe")
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
     return {"ok": True, "action": "opened_system_info"}
 
 
+# app name -> (shell open target, display name)
+_STARTFILE_APPS: Dict[str, Tuple[str, str]] = {
+    "chrome": ("chrome", "Google Chrome"),
+    "notepad": ("notepad.exe", "Notepad"),
+    "vscode": ("code", "Visual Studio Code"),
+    "vs code": ("code", "Visual Studio Code"),
+    "cursor": ("cursor", "Cursor Editor"),
+}
+
+# app name -> (URL, display name)
+_URL_APPS: Dict[str, Tuple[str, str]] = {
+    "youtube": ("https://www.youtube.com", "YouTube"),
+    "whatsapp": ("https://web.whatsapp.com/", "WhatsApp Web"),
+}
+
+
 @function_tool
 async def open_common_app(app: str, query: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -283,40 +542,25 @@ async def open_common_app(app: str, query: Optional[str] = None) -> Dict[str, An
     """
     app = app.lower().strip()
     try:
-        if app == "chrome":
-            await asyncio.to_thread(os.startfile, "chrome")
-            return {"ok": True, "opened": "Google Chrome"}
+        if app in _STARTFILE_APPS:
+            target, name = _STARTFILE_APPS[app]
+            await asyncio.to_thread(_shell_open, target)
+            return {"ok": True, "opened": name}
 
-        elif app == "youtube":
-            webbrowser.open("https://www.youtube.com")
-            return {"ok": True, "opened": "YouTube"}
+        if app in _URL_APPS:
+            url, name = _URL_APPS[app]
+            webbrowser.open(url)
+            return {"ok": True, "opened": name}
 
-        elif app == "notepad":
-            await asyncio.to_thread(os.startfile, "notepad.exe")
-            return {"ok": True, "opened": "Notepad"}
-
-        elif app in ("vscode", "vs code"):
-            await asyncio.to_thread(os.startfile, "code")
-            return {"ok": True, "opened": "Visual Studio Code"}
-
-        elif app == "cursor":
-            await asyncio.to_thread(os.startfile, "cursor")
-            return {"ok": True, "opened": "Cursor Editor"}
-
-        elif app == "whatsapp":
-            webbrowser.open("https://web.whatsapp.com/")
-            return {"ok": True, "opened": "WhatsApp Web"}
-
-        elif app in ("google", "search"):
+        if app in ("google", "search"):
             if not query:
                 webbrowser.open("https://www.google.com")
                 return {"ok": True, "opened": "Google Home"}
-            search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
+            search_url = f"https://www.google.com/search?q={quote_plus(query)}"
             webbrowser.open(search_url)
             return {"ok": True, "opened": search_url}
 
-        else:
-            return {"ok": False, "error": f"Unsupported app: {app}"}
+        return {"ok": False, "error": f"Unsupported app: {app}"}
 
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -325,41 +569,130 @@ async def open_common_app(app: str, query: Optional[str] = None) -> Dict[str, An
 # Camera: capture a photo
 # ---------------------------------------------
 
+# Opening a camera (DirectShow especially) takes 0.5-2 s, so a single
+# long-lived worker thread owns the VideoCapture handle and serves capture
+# jobs from a queue. The handle is released after _CAM_TTL seconds idle.
+_CAM_TTL = 30.0
+_cam_jobs: "queue.Queue[Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Future, int]]]" = queue.Queue()
+_cam_thread: Optional[threading.Thread] = None
+_cam_thread_lock = threading.Lock()
+_photo_seq = itertools.count()
+
+
+def _release_camera(cam) -> None:
+    if cam is not None:
+        try:
+            cam.release()
+        except Exception:
+            pass
+
+
+def _open_camera(camera_index: int):
+    """Open a camera for camera_index, or return None if it is not available."""
+    cv2 = _get_cv2()
+    cam = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW if sys.platform.startswith("win") else 0)
+    if not cam or not cam.isOpened():
+        _release_camera(cam)
+        return None
+    cam.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cam
+
+
+def _set_future_result(fut: asyncio.Future, result: Dict[str, Any]) -> None:
+    if not fut.done():
+        fut.set_result(result)
+
+
+def _cam_loop() -> None:
+    """Camera worker: owns the VideoCapture handle and serves jobs from _cam_jobs."""
+    cam = None
+    cam_idx = -1
+    while True:
+        try:
+            job = _cam_jobs.get(timeout=_CAM_TTL if cam is not None else None)
+        except queue.Empty:
+            _release_camera(cam)
+            cam, cam_idx = None, -1
+            continue
+        if job is None:
+            break
+        loop, fut, camera_index = job
+        try:
+            if _get_cv2() is None:
+                raise ImportError("opencv (cv2) not installed")
+            if cam is None or cam_idx != camera_index or not cam.isOpened():
+                _release_camera(cam)
+                cam = _open_camera(camera_index)
+                cam_idx = camera_index if cam is not None else -1
+            if cam is None:
+                result = {"ok": False, "error": "Camera not available"}
+            else:
+                # drop a possibly stale buffered frame before the real read
+                cam.grab()
+                ret, frame = cam.read()
+                if not ret:
+                    _release_camera(cam)
+                    cam, cam_idx = None, -1
+                    result = {"ok": False, "error": "Failed to read from camera"}
+                else:
+                    cv2 = _get_cv2()
+                    ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                    if ok:
+                        result = {"ok": True, "data": buf.tobytes()}
+                    else:
+                        result = {"ok": False, "error": "Failed to encode photo"}
+        except Exception as e:
+            result = {"ok": False, "error": str(e)}
+        try:
+            loop.call_soon_threadsafe(_set_future_result, fut, result)
+        except RuntimeError:
+            # event loop already closed; nobody is waiting for this result
+            pass
+    _release_camera(cam)
+
+
+def _ensure_cam_thread() -> None:
+    global _cam_thread
+    with _cam_thread_lock:
+        if _cam_thread is None or not _cam_thread.is_alive():
+            _cam_thread = threading.Thread(target=_cam_loop, name="jarvis-camera", daemon=True)
+            _cam_thread.start()
+
+
+@atexit.register
+def _stop_cam_thread() -> None:
+    if _cam_thread is not None and _cam_thread.is_alive():
+        _cam_jobs.put(None)
+        _cam_thread.join(timeout=2)
+
+
 @function_tool
 async def capture_photo(filename: Optional[str] = None, camera_index: int = 0) -> Dict[str, Any]:
     """Capture a single photo from the default camera and save under Pictures/JarvisPhotos.
 
     Returns the saved path on success.
     """
-    if not cv2:
+    # find_spec only locates the package; the import itself happens on the camera thread
+    if importlib.util.find_spec("cv2") is None:
         return {"ok": False, "error": "opencv (cv2) not installed"}
     try:
-        save_dir = Path.home() / "Pictures" / "JarvisPhotos"
+        save_dir = _PICTURES_JARVIS
         save_dir.mkdir(parents=True, exist_ok=True)
         if not filename:
-            filename = f"photo_{int(asyncio.get_event_loop().time() * 1000)}.jpg"
+            # time_ns can tick coarsely on Windows; the counter keeps concurrent captures apart
+            filename = f"photo_{time.time_ns()}_{next(_photo_seq)}.jpg"
         save_path = save_dir / filename
 
-        # capture on thread to avoid blocking
-        def _capture():
-            cam = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW if sys.platform.startswith("win") else 0)
-            try:
-                if not cam or not cam.isOpened():
-                    return {"ok": False, "error": "Camera not available"}
-                ret, frame = cam.read()
-                if not ret:
-                    return {"ok": False, "error": "Failed to read from camera"}
-                # write JPEG
-                cv2.imwrite(str(save_path), frame)
-                return {"ok": True, "path": str(save_path)}
-            finally:
-                try:
-                    cam.release()
-                except Exception:
-                    pass
-
-        result = await asyncio.to_thread(_capture)
-        return result
+        # capture on the camera worker thread to avoid blocking
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        _ensure_cam_thread()
+        _cam_jobs.put((loop, fut, camera_index))
+        result = await fut
+        if not result.get("ok"):
+            return result
+        await asyncio.to_thread(save_path.write_bytes, result["data"])
+        return {"ok": True, "path": str(save_path)}
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
@@ -378,9 +711,9 @@ async def send_whatsapp_message(phone_number: str, message: str) -> Dict[str, An
         if not phone_number or not message:
             return {"ok": False, "error": "Phone number and message required"}
 
-        # encode spaces and some basic characters - for advanced usage use urllib.parse.quote_plus
-        safe_text = message.replace(' ', '%20')
-        whatsapp_url = f"https://api.whatsapp.com/send?phone={phone_number}&text={safe_text}"
+        safe_text = quote_plus(message)
+        safe_phone = quote_plus(phone_number)
+        whatsapp_url = f"https://api.whatsapp.com/send?phone={safe_phone}&text={safe_text}"
         webbrowser.open(whatsapp_url)
         return {"ok": True, "sent_to": phone_number, "message": message}
     except Exception as e:
@@ -5,7 +5,6 @@ import logging
 import os
 import sys
 import asyncio
-import re
 
 from livekit import agents
 from livekit.agents import AgentSession, Agent, RoomInputOptions
@@ -31,31 +30,46 @@ logger = logging.getLogger(__name__)
 ENABLE_MEMORY_INTERCEPTOR = True
 
 
+# Tool list built once at import and shared by every Assistant instance
+_ASSISTANT_TOOLS = [
+    google_search,
+    get_current_datetime,
+    get_weather,
+    open,
+    close,
+    load_memory, save_memory,
+    get_recent_conversations,
+    add_memory_entry,
+    folder_file,
+    Play_file,
+    screenshot_tool,
+    move_cursor_tool,
+    mouse_click_tool,
+    scroll_cursor_tool,
+    type_text_tool,
+    press_key_tool,
+    press_hotkey_tool,
+    control_volume_tool,
+    swipe_gesture_tool,
+]
+
+_realtime_model = None
+
+
+def _get_realtime_model():
+    """Return the shared RealtimeModel, creating it on first use."""
+    global _realtime_model
+    if _realtime_model is None:
+        _realtime_model = google.beta.realtime.RealtimeModel(
+            voice="Charon"
+        )
+    return _realtime_model
+
+
 class Assistant(Agent):
     def __init__(self) -> None:
         super().__init__(instructions=behavior_prompts,
-                         tools=[
-                            google_search,
-                            get_current_datetime,
-                            get_weather,
-                            open, 
-                            close, 
-                            load_memory, save_memory,
-                            get_recent_conversations, 
-                            add_memory_entry, 
-                            folder_file,
-                            Play_file,  
-                            screenshot_tool, 
-                            move_cursor_tool, 
-                            mouse_click_tool, 
-                            scroll_cursor_tool,
-                            type_text_tool, 
-                            press_key_tool, 
-                            press_hotkey_tool, 
-                            control_volume_tool, 
-                            swipe_gesture_tool 
-                            
-                         ]
+                         tools=_ASSISTANT_TOOLS
                          )
 
 
@@ -70,9 +84,7 @@ async def entrypoint(ctx: agents.JobContext):
             print(f"\n🚀 Starting agent session (attempt {retry_count + 1}/{max_retries})...")
             
             session = AgentSession(
-                llm=google.beta.realtime.RealtimeModel(
-                    voice="Charon"
-                )
+                llm=_get_realtime_model()
             )
             
             await session.start(